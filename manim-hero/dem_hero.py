@@ -10,15 +10,38 @@ A 15-second seamless loop animation featuring:
 Usage:
     manimgl dem_hero.py DEMHeroAnimation -o  # Render to file
     manimgl dem_hero.py DEMHeroAnimation     # Preview mode
+    DEM_HERO_GPU=1 manimgl dem_hero.py DEMHeroAnimation  # Metaballs drawn by a fragment shader
 """
 
 from manimlib import *
+import functools
+import hashlib
+import math
+import os
+import queue
+import tempfile
+import threading
 import numpy as np
 from pathlib import Path
 import cv2
 
+try:
+    import av
+    HAS_PYAV = True
+except ImportError:  # PyAV is optional; VideoTexture falls back to OpenCV
+    HAS_PYAV = False
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # Numba is optional; MetaballField falls back to NumPy
+    HAS_NUMBA = False
+
 # Configuration
 VIDEO_PATH = Path(__file__).parent / "source_video.mp4"
+SHADER_DIR = Path(__file__).parent / "shaders"
+FRAME_CACHE_DIR = Path.home() / ".cache" / "dem_hero"  # Decoded video frames
+USE_GPU_METABALLS = os.environ.get("DEM_HERO_GPU") == "1"
 FRAME_RATE = 60
 TOTAL_DURATION = 15.0  # seconds
 
@@ -35,20 +58,175 @@ EXIT_END = 15.0
 # Colors
 BACKGROUND_COLOR = "#0a0a0f"
 
+# Marching squares lookup: case code -> edge pairs joined by a contour segment.
+# Corner bits: 1 = bottom-left, 2 = bottom-right, 4 = top-right, 8 = top-left.
+# Edges: 0 = bottom, 1 = right, 2 = top, 3 = left.
+CONTOUR_LUT = (
+    (),
+    ((3, 0),),
+    ((0, 1),),
+    ((3, 1),),
+    ((1, 2),),
+    ((3, 0), (1, 2)),  # Saddle
+    ((0, 2),),
+    ((3, 2),),
+    ((2, 3),),
+    ((0, 2),),
+    ((0, 1), (2, 3)),  # Saddle
+    ((1, 2),),
+    ((3, 1),),
+    ((0, 1),),
+    ((3, 0),),
+    (),
+)
+
+# Cell edge -> (di, dj, is_vertical) of the grid edge it lies on
+CELL_EDGES = ((0, 0, 0), (1, 0, 1), (0, 1, 0), (0, 0, 1))
+
 
 class VideoTexture:
     """Loads and provides frames from a video file."""
 
-    def __init__(self, video_path: str, target_fps: int = 30):
+    def __init__(self, video_path: str, target_fps: int = 30, memmap_path: str = None, use_cache: bool = True):
         self.video_path = str(video_path)
         self.target_fps = target_fps
-        self.frames = []
+        # Optional file backing for the frame buffer on low-RAM machines
+        self.memmap_path = memmap_path
+        # Reuse frames decoded by a previous run from FRAME_CACHE_DIR
+        self.use_cache = use_cache
+        self.frames = np.empty((0, 1080, 1920, 3), dtype=np.uint8)
         self.frame_count = 0
         self.current_frame_idx = 0
         self._load_video()
 
+    def _allocate_frames(self, count: int, height: int, width: int) -> np.ndarray:
+        """Allocate one contiguous (N, H, W, 3) RGB buffer for all frames."""
+        shape = (max(count, 1), height, width, 3)  # A file mapping cannot be empty
+        if self.memmap_path is not None:
+            return np.memmap(self.memmap_path, dtype=np.uint8, mode='w+', shape=shape)
+        return np.empty(shape, dtype=np.uint8)
+
+    def _reserve_frame(self, frames: np.ndarray, index: int, height: int, width: int) -> np.ndarray:
+        """
+        Make sure the buffer can hold frame `index` of size (height, width).
+        Frame counts and dimensions from container metadata are only estimates,
+        so the buffer is reshaped to the first decoded frame and doubled when full.
+        """
+        if index == 0 and frames.shape[1:3] != (height, width):
+            frames = self._allocate_frames(len(frames), height, width)
+        if index < len(frames):
+            return frames
+
+        shape = (2 * len(frames),) + frames.shape[1:]
+        if self.memmap_path is not None:
+            frames.flush()
+            os.truncate(self.memmap_path, int(np.prod(shape)))
+            return np.memmap(self.memmap_path, dtype=np.uint8, mode='r+', shape=shape)
+        grown = np.empty(shape, dtype=np.uint8)
+        grown[:len(frames)] = frames
+        return grown
+
     def _load_video(self):
-        """Extract frames from video file."""
+        """Extract frames from video file, or the frame cache if present."""
+        cache_path = self._cache_path() if self.use_cache else None
+        if cache_path is not None and cache_path.exists():
+            # Memory-mapped, so frames are paged in as they are used
+            self.frames = np.load(cache_path, mmap_mode='r')
+            self.frame_count = len(self.frames)
+            print(f"Loaded {self.frame_count} frames from cache")
+            return
+
+        if HAS_PYAV:
+            self._load_video_pyav()
+        else:
+            self._load_video_opencv()
+        print(f"Loaded {self.frame_count} frames from video")
+
+        if cache_path is not None and self.frame_count > 0:
+            self._save_cache(cache_path)
+
+    def _cache_path(self):
+        """
+        Frame cache file keyed by video path, modification time, size and target fps.
+        Named <source key>-<key>.npy, the source key covering only path and fps,
+        so entries for older versions of the same video can be found.
+        """
+        try:
+            stat = os.stat(self.video_path)
+        except OSError:
+            return None
+        path = os.path.abspath(self.video_path)
+        source_key = hashlib.blake2b(f"{path}|{self.target_fps}".encode()).hexdigest()[:16]
+        source = f"{path}|{stat.st_mtime_ns}|{stat.st_size}|{self.target_fps}"
+        key = hashlib.blake2b(source.encode()).hexdigest()[:16]
+        return FRAME_CACHE_DIR / f"{source_key}-{key}.npy"
+
+    def _save_cache(self, cache_path: Path):
+        """Write decoded frames to the cache, via a temporary file so readers never see a partial one."""
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique per writer, so concurrent first runs never share a temporary file
+            with tempfile.NamedTemporaryFile(
+                dir=cache_path.parent, prefix=f"{cache_path.stem}.", suffix=".tmp.npy", delete=False,
+            ) as tmp:
+                tmp_path = tmp.name
+                np.save(tmp, self.frames)
+            os.replace(tmp_path, cache_path)
+            tmp_path = None
+
+            # Drop entries for older versions of the same video (skipping other writers' temp files)
+            source_key = cache_path.name.split("-")[0]
+            for stale in cache_path.parent.glob(f"{source_key}-*.npy"):
+                if stale != cache_path and "." not in stale.stem:
+                    stale.unlink(missing_ok=True)
+        except OSError as e:
+            print(f"Warning: Could not cache video frames: {e}")
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+
+    def _load_video_pyav(self):
+        """Decode frames with PyAV (multithreaded FFmpeg decode, RGB output)."""
+        try:
+            container = av.open(self.video_path)
+        except av.error.FFmpegError as e:
+            raise ValueError(f"Could not open video: {self.video_path}") from e
+        if not container.streams.video:
+            container.close()
+            raise ValueError(f"No video stream in: {self.video_path}")
+
+        stream = container.streams.video[0]
+        stream.thread_type = 'AUTO'
+
+        video_fps = float(stream.average_rate or self.target_fps)
+        frame_skip = max(1, int(video_fps / self.target_fps))
+
+        # Frame count is often missing (e.g. MKV/WebM); the buffer grows as needed
+        source_count = stream.frames
+        if source_count == 0 and stream.duration is not None:
+            source_count = int(float(stream.duration * stream.time_base) * video_fps + 0.5)
+        if source_count == 0 and container.duration is not None:
+            source_count = int(container.duration / av.time_base * video_fps + 0.5)
+        capacity = -(-source_count // frame_skip)  # ceil division
+        frames = self._allocate_frames(capacity, stream.codec_context.height, stream.codec_context.width)
+
+        loaded = 0
+        for frame_idx, frame in enumerate(container.decode(stream)):
+            if frame_idx % frame_skip == 0:
+                frames = self._reserve_frame(frames, loaded, frame.height, frame.width)
+                if (frame.height, frame.width) != frames.shape[1:3]:
+                    # Resolution changed mid-stream
+                    frame = frame.reformat(width=frames.shape[2], height=frames.shape[1])
+                # FFmpeg's scaler converts straight to RGB
+                frames[loaded] = frame.to_ndarray(format='rgb24')
+                loaded += 1
+
+        container.close()
+        self.frames = frames[:loaded]
+        self.frame_count = loaded
+
+    def _load_video_opencv(self):
+        """Decode frames with OpenCV."""
         cap = cv2.VideoCapture(self.video_path)
         if not cap.isOpened():
             raise ValueError(f"Could not open video: {self.video_path}")
@@ -56,22 +234,67 @@ class VideoTexture:
         video_fps = cap.get(cv2.CAP_PROP_FPS)
         frame_skip = max(1, int(video_fps / self.target_fps))
 
-        frame_idx = 0
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            if frame_idx % frame_skip == 0:
-                # Convert BGR to RGB
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                self.frames.append(frame_rgb)
-
-            frame_idx += 1
-
-        cap.release()
-        self.frame_count = len(self.frames)
-        print(f"Loaded {self.frame_count} frames from video")
+        source_count = max(0, int(cap.get(cv2.CAP_PROP_FRAME_COUNT)))
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        capacity = -(-source_count // frame_skip)  # ceil division
+        frames = self._allocate_frames(capacity, height, width)
+
+        # Decode on a worker thread while this thread converts into the buffer
+        decoded = queue.Queue(maxsize=8)
+        stop = threading.Event()
+
+        def put(item):
+            # Give up once the consumer has stopped so the worker never blocks
+            while not stop.is_set():
+                try:
+                    decoded.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def decode_frames():
+            try:
+                frame_idx = 0
+                while not stop.is_set() and cap.grab():
+                    if frame_idx % frame_skip == 0:
+                        ret, frame = cap.retrieve()
+                        if not ret or not put(frame):
+                            break
+                    frame_idx += 1
+            finally:
+                put(None)
+
+        worker = threading.Thread(target=decode_frames, daemon=True)
+        worker.start()
+
+        loaded = 0
+        try:
+            while True:
+                frame = decoded.get()
+                if frame is None:
+                    break
+                frames = self._reserve_frame(frames, loaded, *frame.shape[:2])
+                if frame.shape[:2] != frames.shape[1:3]:
+                    # Resolution changed mid-stream
+                    frame = cv2.resize(frame, (frames.shape[2], frames.shape[1]))
+                # Convert BGR to RGB directly into the frame buffer
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frames[loaded])
+                loaded += 1
+        finally:
+            # Unblock and reap the worker even if conversion raised
+            stop.set()
+            while True:
+                try:
+                    decoded.get_nowait()
+                except queue.Empty:
+                    break
+            worker.join()
+            cap.release()
+
+        self.frames = frames[:loaded]
+        self.frame_count = loaded
 
     def get_frame(self, time: float) -> np.ndarray:
         """Get frame at given time (loops automatically)."""
@@ -82,66 +305,425 @@ class VideoTexture:
         return self.frames[frame_idx]
 
 
+if HAS_NUMBA:
+    @njit(fastmath=True, cache=True)
+    def _field_at(bx, by, r2, x, y):
+        """Metaball field value at a single point."""
+        total = 0.0
+        for k in range(bx.shape[0]):
+            dx = x - bx[k]
+            dy = y - by[k]
+            total += r2[k] / (dx * dx + dy * dy + 0.0001)
+        return total
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _inside_bits(bx, by, r2, threshold, x_min, y_min, step_x, step_y, res, active):
+        """
+        Field values thresholded straight into packed inside-bits; only
+        corners of cells flagged in `active` are sampled, the rest stay 0.
+        Returns (res + 1, n_bytes) uint8 array; bit j of row i is corner (i, j).
+        """
+        # Spare zero byte at the end of each row for the shifted reads
+        n_bytes = (res + 1 + 7) // 8 + 1
+        inside_bits = np.zeros((res + 1, n_bytes), dtype=np.uint8)
+
+        # Only corners of active cells are sampled
+        needed = np.zeros((res + 1, res + 1), dtype=np.bool_)
+        for i in range(res):
+            for j in range(res):
+                if active[i, j]:
+                    needed[i, j] = True
+                    needed[i + 1, j] = True
+                    needed[i, j + 1] = True
+                    needed[i + 1, j + 1] = True
+
+        for i in prange(res + 1):
+            x = x_min + i * step_x
+            for j in range(res + 1):
+                if needed[i, j] and _field_at(bx, by, r2, x, y_min + j * step_y) >= threshold:
+                    inside_bits[i, j >> 3] |= np.uint8(1 << (j & 7))
+        return inside_bits
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _boundary_kernel(bx, by, r2, threshold, x_min, y_min, step_x, step_y, res, active, out):
+        """
+        Fused field evaluation + marching squares cell classification.
+        Writes boundary cell centers to the start of `out` (res * res, 2)
+        and returns their count.
+        """
+        inside_bits = _inside_bits(bx, by, r2, threshold, x_min, y_min, step_x, step_y, res, active)
+        n_bytes = inside_bits.shape[1]
+
+        # Each column of cells writes into its own slot of `out`, compacted afterwards
+        cell_centers = out.reshape((res, res, 2))
+        counts = np.zeros(res, dtype=np.int64)
+
+        for i in prange(res):
+            x_center = x_min + (i + 0.5) * step_x
+            n = 0
+            for k in range(n_bytes - 1):
+                # Eight cells at once: corners (i, j), (i + 1, j) and the rows shifted to j + 1
+                c00 = np.int64(inside_bits[i, k])
+                c10 = np.int64(inside_bits[i + 1, k])
+                c01 = ((c00 >> 1) | (np.int64(inside_bits[i, k + 1]) << 7)) & 0xFF
+                c11 = ((c10 >> 1) | (np.int64(inside_bits[i + 1, k + 1]) << 7)) & 0xFF
+
+                # If not all corners are the same, we're on boundary
+                mixed = (c00 ^ c10) | (c00 ^ c01) | (c00 ^ c11)
+                if mixed == 0:
+                    continue
+                for bit in range(8):
+                    j = k * 8 + bit
+                    if (mixed >> bit) & 1 and j < res and active[i, j]:
+                        cell_centers[i, n, 0] = x_center
+                        cell_centers[i, n, 1] = y_min + (j + 0.5) * step_y
+                        n += 1
+            counts[i] = n
+
+        # In place: row i starts at i * res, never before the write position
+        k = 0
+        for i in range(res):
+            for n in range(counts[i]):
+                out[k, 0] = cell_centers[i, n, 0]
+                out[k, 1] = cell_centers[i, n, 1]
+                k += 1
+        return k
+
+
 class MetaballField:
     """Computes metaball implicit surface field values."""
 
+    TILE_SIZE = 8  # Cells per side of a coarse rejection tile
+
+    # Generated field functions, keyed by blob count
+    _field_functions = {}
+
     def __init__(self, threshold: float = 1.0):
         self.threshold = threshold
-        self.blobs = []  # List of (x, y, radius)
+        # Blobs stored as parallel arrays (x, y, radius squared)
+        self.bx = np.empty(0)
+        self.by = np.empty(0)
+        self.r2 = np.empty(0)
+        # Flat (bx0, by0, r2_0, bx1, ...) arguments for the generated field function
+        self._blob_args = None
+        self._boundary_buf = None
+
+    @property
+    def blobs(self) -> list:
+        """Blobs as a list of (x, y, radius)."""
+        return [
+            (x, y, r)
+            for x, y, r in zip(self.bx.tolist(), self.by.tolist(), np.sqrt(self.r2).tolist())
+        ]
 
     def add_blob(self, x: float, y: float, radius: float):
-        self.blobs.append([x, y, radius])
+        self.bx = np.concatenate([self.bx, [x]])
+        self.by = np.concatenate([self.by, [y]])
+        self.r2 = np.concatenate([self.r2, [radius * radius]])
+        self._blob_args = None
 
     def clear_blobs(self):
-        self.blobs = []
+        self.bx = np.empty(0)
+        self.by = np.empty(0)
+        self.r2 = np.empty(0)
+        self._blob_args = None
 
     def set_blobs(self, blobs: list):
-        self.blobs = [list(b) for b in blobs]
+        self.clear_blobs()
+        if len(blobs) == 0:
+            return
+        arr = np.asarray(blobs, dtype=np.float64).reshape(-1, 3)
+        self.bx = np.concatenate([self.bx, arr[:, 0]])
+        self.by = np.concatenate([self.by, arr[:, 1]])
+        self.r2 = np.concatenate([self.r2, arr[:, 2] ** 2])
+        self._blob_args = None
+
+    @classmethod
+    def _compile(cls, blob_count: int):
+        """
+        Generate a field function unrolled for blob_count blobs.
+        It takes (x, y, bx0, by0, r2_0, bx1, ...) and returns the field value.
+        """
+        if blob_count not in cls._field_functions:
+            params = "".join(f", bx{k}, by{k}, r2_{k}" for k in range(blob_count))
+            terms = " + ".join(
+                f"r2_{k} / ((x - bx{k}) ** 2 + (y - by{k}) ** 2 + 0.0001)"  # Avoid division by zero
+                for k in range(blob_count)
+            )
+            source = f"def field_value(x, y{params}):\n    return {terms or '0.0'}\n"
+            namespace = {}
+            exec(source, namespace)
+            cls._field_functions[blob_count] = namespace["field_value"]
+        return cls._field_functions[blob_count]
 
     def field_value(self, x: float, y: float) -> float:
         """Calculate metaball field value at point (x, y)."""
-        total = 0.0
-        for bx, by, r in self.blobs:
-            dx = x - bx
-            dy = y - by
-            dist_sq = dx * dx + dy * dy + 0.0001  # Avoid division by zero
-            total += (r * r) / dist_sq
-        return total
+        if self._blob_args is None:
+            self._blob_args = tuple(np.column_stack([self.bx, self.by, self.r2]).ravel().tolist())
+        return self._compile(len(self.r2))(x, y, *self._blob_args)
 
     def is_inside(self, x: float, y: float) -> bool:
         """Check if point is inside the metaball surface."""
         return self.field_value(x, y) >= self.threshold
 
-    def get_boundary_points(self, resolution: int = 100, bounds: tuple = (-8, 8, -4.5, 4.5)) -> list:
+    def field_grid(self, x_lin: np.ndarray, y_lin: np.ndarray) -> np.ndarray:
+        """
+        Calculate field values on the grid spanned by x_lin and y_lin.
+        Returns a (len(x_lin), len(y_lin)) float32 array indexed [i, j].
+        """
+        X, Y = np.meshgrid(x_lin, y_lin, indexing='ij')
+        dist_sq = (
+            (X - self.bx[:, None, None]) ** 2
+            + (Y - self.by[:, None, None]) ** 2
+            + 0.0001
+        )
+        return np.sum(self.r2[:, None, None] / dist_sq, axis=0).astype(np.float32)
+
+    def field_points(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Calculate field values at the points (x[k], y[k])."""
+        dist_sq = (x - self.bx[:, None]) ** 2 + (y - self.by[:, None]) ** 2 + 0.0001
+        return np.sum(self.r2[:, None] / dist_sq, axis=0)
+
+    def active_cells(self, resolution: int, bounds: tuple) -> np.ndarray:
+        """
+        Mask of grid cells that may lie on the boundary.
+        Cells far from every blob, and tiles that are provably all
+        inside or all outside, are skipped by marching squares.
+        """
+        x_min, x_max, y_min, y_max = bounds
+        step_x = (x_max - x_min) / resolution
+        step_y = (y_max - y_min) / resolution
+
+        active = np.zeros((resolution, resolution), dtype=bool)
+        blob_count = len(self.r2)
+        if blob_count == 0:
+            return active
+
+        # Beyond this radius a blob contributes less than threshold / blob_count,
+        # so a point outside every radius cannot reach the threshold
+        radius = np.sqrt(self.r2 * blob_count / self.threshold)
+        i_lo = np.clip(np.floor((self.bx - radius - x_min) / step_x).astype(int) - 1, 0, resolution)
+        i_hi = np.clip(np.ceil((self.bx + radius - x_min) / step_x).astype(int) + 1, 0, resolution)
+        j_lo = np.clip(np.floor((self.by - radius - y_min) / step_y).astype(int) - 1, 0, resolution)
+        j_hi = np.clip(np.ceil((self.by + radius - y_min) / step_y).astype(int) + 1, 0, resolution)
+        for i0, i1, j0, j1 in zip(i_lo, i_hi, j_lo, j_hi):
+            active[i0:i1, j0:j1] = True
+
+        # Bound the field over each tile: the nearest point of the tile to a
+        # blob gives its maximum contribution, the farthest point its minimum
+        tile = self.TILE_SIZE
+        tile_x0 = x_min + np.arange(0, resolution, tile) * step_x
+        tile_x1 = x_min + np.minimum(np.arange(tile, resolution + tile, tile), resolution) * step_x
+        tile_y0 = y_min + np.arange(0, resolution, tile) * step_y
+        tile_y1 = y_min + np.minimum(np.arange(tile, resolution + tile, tile), resolution) * step_y
+
+        bx = self.bx[:, None]
+        by = self.by[:, None]
+        near_dx = np.maximum(np.maximum(tile_x0 - bx, bx - tile_x1), 0)
+        near_dy = np.maximum(np.maximum(tile_y0 - by, by - tile_y1), 0)
+        far_dx = np.maximum(np.abs(tile_x0 - bx), np.abs(tile_x1 - bx))
+        far_dy = np.maximum(np.abs(tile_y0 - by), np.abs(tile_y1 - by))
+
+        r2 = self.r2[:, None, None]
+        field_max = np.sum(r2 / (near_dx[:, :, None] ** 2 + near_dy[:, None, :] ** 2 + 0.0001), axis=0)
+        field_min = np.sum(r2 / (far_dx[:, :, None] ** 2 + far_dy[:, None, :] ** 2 + 0.0001), axis=0)
+        tile_mixed = (field_max >= self.threshold) & (field_min < self.threshold)
+
+        active &= np.repeat(np.repeat(tile_mixed, tile, axis=0), tile, axis=1)[:resolution, :resolution]
+        return active
+
+    def get_boundary_points(self, resolution: int = 100, bounds: tuple = (-8, 8, -4.5, 4.5)) -> np.ndarray:
         """
         Get boundary points using marching squares.
-        Returns list of (x, y) points on the boundary.
+        Returns (N, 2) array of (x, y) points on the boundary. It is a view
+        into a buffer that the next call overwrites; copy it to keep it.
+        """
+        x_min, x_max, y_min, y_max = bounds
+        step_x = (x_max - x_min) / resolution
+        step_y = (y_max - y_min) / resolution
+        active = self.active_cells(resolution, bounds)
+
+        # Output buffer reused across calls at the same resolution
+        if self._boundary_buf is None or len(self._boundary_buf) != resolution * resolution:
+            self._boundary_buf = np.empty((resolution * resolution, 2))
+        out = self._boundary_buf
+
+        if HAS_NUMBA:
+            n = _boundary_kernel(
+                self.bx, self.by, self.r2, float(self.threshold),
+                float(x_min), float(y_min), step_x, step_y, resolution, active, out,
+            )
+            return out[:n]
+
+        sampled = self._sample_inside(resolution, bounds, active)
+        if sampled is None:
+            return out[:0]
+        i0, j0, inside, active = sampled
+        case = self._case_codes(inside)
+
+        # If not all corners are the same, we're on boundary
+        cells = np.argwhere((case != 0) & (case != 15) & active) + (i0, j0)
+
+        # Center of each boundary cell
+        n = len(cells)
+        out[:n, 0] = x_min + (cells[:, 0] + 0.5) * step_x
+        out[:n, 1] = y_min + (cells[:, 1] + 0.5) * step_y
+        return out[:n]
+
+    def get_contours(self, resolution: int = 100, bounds: tuple = (-8, 8, -4.5, 4.5)) -> list:
+        """
+        Trace the boundary using marching squares.
+        Returns list of (N, 2) polylines; closed loops repeat their first point.
+        """
+        x_min, x_max, y_min, y_max = bounds
+        step_x = (x_max - x_min) / resolution
+        step_y = (y_max - y_min) / resolution
+
+        if len(self.r2) == 1:
+            # A single blob's surface is a circle of radius sqrt(r^2 / threshold - eps)
+            radius_sq = self.r2[0] / self.threshold - 0.0001
+            if radius_sq <= 0:
+                return []
+            radius = math.sqrt(radius_sq)
+            cx, cy = self.bx[0], self.by[0]
+            if x_min <= cx - radius and cx + radius <= x_max and y_min <= cy - radius and cy + radius <= y_max:
+                # About one point per grid cell along the circumference
+                n_points = max(8, int(2 * math.pi * radius / min(step_x, step_y)))
+                angles = np.linspace(0, 2 * math.pi, n_points + 1)
+                angles[-1] = 0  # Close the loop exactly
+                return [np.column_stack([cx + radius * np.cos(angles), cy + radius * np.sin(angles)])]
+
+        sampled = self._sample_inside(resolution, bounds, self.active_cells(resolution, bounds))
+        if sampled is None:
+            return []
+        i0, j0, inside, active = sampled
+        case = self._case_codes(inside)
+        cells = np.argwhere((case != 0) & (case != 15) & active)
+
+        # Link grid edges crossed by the contour; each edge is shared by at most two cells
+        stride = inside.shape[1]
+        neighbors = {}
+        for i, j in cells.tolist():
+            for edge_a, edge_b in CONTOUR_LUT[case[i, j]]:
+                di, dj, vertical = CELL_EDGES[edge_a]
+                key_a = 2 * ((i + di) * stride + j + dj) + vertical
+                di, dj, vertical = CELL_EDGES[edge_b]
+                key_b = 2 * ((i + di) * stride + j + dj) + vertical
+                neighbors.setdefault(key_a, []).append(key_b)
+                neighbors.setdefault(key_b, []).append(key_a)
+
+        # Walk the edge graph, starting open chains (clipped by bounds) at their ends
+        chains = []
+        visited = set()
+        ends = [key for key, linked in neighbors.items() if len(linked) == 1]
+        for start in ends + list(neighbors):
+            if start in visited:
+                continue
+            chain = [start]
+            visited.add(start)
+            current = start
+            while True:
+                following = [key for key in neighbors[current] if key not in visited]
+                if not following:
+                    break
+                current = following[0]
+                chain.append(current)
+                visited.add(current)
+            if len(chain) > 2 and start in neighbors[current]:
+                chain.append(start)
+            chains.append(chain)
+
+        if not chains:
+            return []
+        keys = np.concatenate(chains)
+        vertical = keys & 1
+        i, j = np.divmod(keys >> 1, stride)
+
+        # Interpolate the threshold crossing along each edge, sampling the field at edge ends only
+        x_a = x_min + (i0 + i) * step_x
+        y_a = y_min + (j0 + j) * step_y
+        f_a = self.field_points(x_a, y_a)
+        f_b = self.field_points(x_a + (1 - vertical) * step_x, y_a + vertical * step_y)
+        t = (self.threshold - f_a) / (f_b - f_a)
+
+        points = np.empty((len(keys), 2))
+        points[:, 0] = x_a + t * (1 - vertical) * step_x
+        points[:, 1] = y_a + t * vertical * step_y
+        return np.split(points, np.cumsum([len(chain) for chain in chains[:-1]]))
+
+    def _case_codes(self, inside: np.ndarray) -> np.ndarray:
+        """
+        Pack the inside flags of each cell's corners into a CONTOUR_LUT case code.
+        Returns (n_x - 1, n_y - 1) uint8 array of values 0..15.
+        """
+        inside = inside.view(np.uint8)
+        return (
+            inside[:-1, :-1]
+            | (inside[1:, :-1] << 1)
+            | (inside[1:, 1:] << 2)
+            | (inside[:-1, 1:] << 3)
+        )
+
+    def _sample_field(self, resolution: int, bounds: tuple, active: np.ndarray):
+        """
+        Sample the field at cell corners over the bounding box of active cells.
+        Returns (i0, j0, field, active) cropped to that box, or None if no cell is active.
         """
         x_min, x_max, y_min, y_max = bounds
         step_x = (x_max - x_min) / resolution
         step_y = (y_max - y_min) / resolution
 
-        boundary_points = []
+        active_idx = np.argwhere(active)
+        if len(active_idx) == 0:
+            return None
+
+        i0, j0 = active_idx.min(axis=0)
+        i1, j1 = active_idx.max(axis=0) + 1
+        x_lin = x_min + np.arange(i0, i1 + 1) * step_x
+        y_lin = y_min + np.arange(j0, j1 + 1) * step_y
+        return i0, j0, self.field_grid(x_lin, y_lin), active[i0:i1, j0:j1]
+
+    def _sample_inside(self, resolution: int, bounds: tuple, active: np.ndarray):
+        """
+        Inside flags at cell corners, from the Numba kernel when available.
+        Returns (i0, j0, inside, active) with corner (i0, j0) at inside[0, 0],
+        or None if no cell is active.
+        """
+        if not HAS_NUMBA:
+            sampled = self._sample_field(resolution, bounds, active)
+            if sampled is None:
+                return None
+            i0, j0, field, active = sampled
+            return i0, j0, field >= self.threshold, active
+
+        if not active.any():
+            return None
+        x_min, x_max, y_min, y_max = bounds
+        inside_bits = _inside_bits(
+            self.bx, self.by, self.r2, float(self.threshold),
+            float(x_min), float(y_min), (x_max - x_min) / resolution, (y_max - y_min) / resolution,
+            resolution, active,
+        )
+        inside = np.unpackbits(inside_bits, axis=1, count=resolution + 1, bitorder='little').view(bool)
+        return 0, 0, inside, active
 
-        for i in range(resolution):
-            for j in range(resolution):
-                x = x_min + i * step_x
-                y = y_min + j * step_y
 
-                # Sample corners of cell
-                corners = [
-                    self.is_inside(x, y),
-                    self.is_inside(x + step_x, y),
-                    self.is_inside(x + step_x, y + step_y),
-                    self.is_inside(x, y + step_y),
-                ]
+@functools.lru_cache(maxsize=16)
+def _cached_text_points(text: str, font: str, weight: str, font_size: int) -> tuple:
+    """Build a Text once and keep the points of each letter."""
+    text_mob = Text(text, font=font, weight=weight, font_size=font_size)
+    return tuple(letter.get_points().copy() for letter in text_mob)
 
-                # If not all same, we're on boundary
-                if not all(corners) and any(corners):
-                    # Add center of cell as boundary point
-                    boundary_points.append((x + step_x/2, y + step_y/2))
 
-        return boundary_points
+def cached_text(text: str, font: str = "SF Pro Display", weight: str = BOLD, font_size: int = 120) -> VGroup:
+    """
+    White filled text as a VGroup of letters.
+    Glyph outlines are only built once per (text, font, weight, font_size).
+    """
+    return VGroup(*[
+        VMobject(fill_color=WHITE, fill_opacity=1, stroke_width=0).set_points(points)
+        for points in _cached_text_points(text, font, weight, font_size)
+    ])
 
 
 class VideoMaskedText(VGroup):
@@ -156,12 +738,7 @@ class VideoMaskedText(VGroup):
         self.video_texture = video_texture
 
         # Create text mobject
-        self.text_mob = Text(
-            text,
-            font="SF Pro Display",
-            weight=BOLD,
-            font_size=120,
-        )
+        self.text_mob = cached_text(text)
         self.text_mob.set_fill(WHITE, opacity=1)
         self.text_mob.set_stroke(WHITE, width=0)
 
@@ -208,43 +785,95 @@ class MetaballMobject(VMobject):
 
     def generate_points(self):
         """Generate the boundary path from metaball field."""
-        boundary = self.metaball_field.get_boundary_points(
-            resolution=self.resolution,
-            bounds=(-8, 8, -4.5, 4.5)
-        )
+        contours = [
+            contour for contour in self.metaball_field.get_contours(
+                resolution=self.resolution,
+                bounds=(-8, 8, -4.5, 4.5)
+            )
+            if len(contour) >= 3
+        ]
 
-        if len(boundary) < 3:
+        if not contours:
             # Not enough points for a shape
             self.set_points([ORIGIN])
             return
 
-        # Sort points to form a continuous boundary (approximate)
-        # Use convex hull as simple approach
-        from scipy.spatial import ConvexHull
-
-        points_array = np.array(boundary)
-        try:
-            hull = ConvexHull(points_array)
-            hull_points = points_array[hull.vertices]
-
+        # One subpath per contour, already ordered along the boundary
+        for index, contour in enumerate(contours):
             # Convert to 3D points for ManimGL
-            points_3d = np.zeros((len(hull_points), 3))
-            points_3d[:, 0] = hull_points[:, 0]
-            points_3d[:, 1] = hull_points[:, 1]
-
-            # Close the path
-            points_3d = np.vstack([points_3d, points_3d[0:1]])
+            points_3d = np.zeros((len(contour), 3))
+            points_3d[:, :2] = contour
 
-            self.set_points_smoothly(points_3d)
-        except Exception:
-            # Fallback to circle if hull fails
-            self.set_points(Circle(radius=1).get_points())
+            if index == 0:
+                self.set_points_smoothly(points_3d)
+            else:
+                self.append_vectorized_mobject(VMobject().set_points_smoothly(points_3d))
 
     def update_from_field(self):
         """Regenerate points based on current field state."""
         self.generate_points()
 
 
+class MetaballShaderMobject(Mobject):
+    """
+    Renders a metaball implicit surface with a fragment shader.
+    The field is summed and thresholded per pixel on a quad covering the bounds.
+    Blobs can be stretched into ellipses, as _blob_stretch describes them.
+    """
+
+    shader_folder: str = str(SHADER_DIR / "metaball")
+    MAX_BLOBS = 8  # Must match the blob uniforms in frag.glsl
+
+    def __init__(self, metaball_field: MetaballField, bounds: tuple = (-8, 8, -4.5, 4.5), **kwargs):
+        self.metaball_field = metaball_field
+        self.bounds = bounds
+        super().__init__(**kwargs)
+        self.update_from_field()
+
+    def init_data(self):
+        super().init_data(length=4)
+        x_min, x_max, y_min, y_max = self.bounds
+        self.data["point"][:] = [
+            (x_min, y_max, 0),
+            (x_min, y_min, 0),
+            (x_max, y_max, 0),
+            (x_max, y_min, 0),
+        ]
+
+    def init_uniforms(self):
+        super().init_uniforms()
+        self.uniforms["threshold"] = 1.0
+        self.uniforms["n_blobs"] = 0.0
+        for i in range(self.MAX_BLOBS):
+            self.uniforms[f"blob{i}"] = np.zeros(3)
+            self.uniforms[f"shape{i}"] = np.array([1.0, 0.0, 1.0])
+
+    def update_from_field(self, shapes: list = None):
+        """
+        Upload the current blobs and threshold as shader uniforms.
+        shapes optionally gives a (cos, sin, stretch) per blob; blobs are circles otherwise.
+        """
+        field = self.metaball_field
+        blob_count = len(field.r2)
+        if blob_count > self.MAX_BLOBS:
+            raise ValueError(f"MetaballShaderMobject supports at most {self.MAX_BLOBS} blobs, got {blob_count}")
+
+        blobs = np.zeros((self.MAX_BLOBS, 3))
+        blobs[:blob_count, 0] = field.bx
+        blobs[:blob_count, 1] = field.by
+        blobs[:blob_count, 2] = np.sqrt(field.r2)
+        stretches = np.tile([1.0, 0.0, 1.0], (self.MAX_BLOBS, 1))
+        if shapes is not None:
+            stretches[:blob_count] = shapes
+        self.set_uniform(
+            threshold=float(field.threshold),
+            n_blobs=float(blob_count),
+            **{f"blob{i}": blobs[i] for i in range(self.MAX_BLOBS)},
+            **{f"shape{i}": stretches[i] for i in range(self.MAX_BLOBS)},
+        )
+        return self
+
+
 class BlobPhysics:
     """
     Simple spring physics for blob movement.
@@ -281,7 +910,7 @@ class BlobPhysics:
         self.y += self.vy
 
         # Stretch based on velocity
-        speed = np.sqrt(self.vx**2 + self.vy**2)
+        speed = math.hypot(self.vx, self.vy)
         stretch_factor = min(speed / 0.5, self.max_stretch - 1)
         self.radius = self.base_radius * (1 + stretch_factor * 0.3)
 
@@ -289,6 +918,45 @@ class BlobPhysics:
         return (self.x, self.y)
 
 
+def _blob_stretch(vx: float, vy: float, stretch_speed: float = 0.1) -> tuple:
+    """
+    Stretch of a blob moving at (vx, vy), as (cos, sin, stretch).
+    Faster than stretch_speed the blob becomes an ellipse with semi-axes
+    (radius * stretch, radius / stretch), the long one along its velocity.
+    """
+    speed = math.hypot(vx, vy)
+    if speed > stretch_speed:
+        return vx / speed, vy / speed, 1 + min(speed * 2, 0.5)
+    return 1.0, 0.0, 1.0
+
+
+def _update_blob_shape(
+    blob_mob: VMobject,
+    unit_pts: np.ndarray,
+    x: float,
+    y: float,
+    vx: float,
+    vy: float,
+    radius: float = 1.5,
+    stretch_speed: float = 0.1,
+) -> VMobject:
+    """
+    Set blob_mob's points to an affine image of unit circle points.
+    Faster than stretch_speed the blob is an ellipse stretched along its
+    velocity, otherwise a circle of the given radius, centered at (x, y).
+    """
+    # Rotate an ellipse with semi-axes (radius * stretch, radius / stretch)
+    cos_a, sin_a, stretch = _blob_stretch(vx, vy, stretch_speed)
+    shape = np.array([
+        [radius * stretch * cos_a, -radius / stretch * sin_a, 0],
+        [radius * stretch * sin_a, radius / stretch * cos_a, 0],
+        [0, 0, 1],
+    ])
+
+    blob_mob.set_points(np.matmul(unit_pts, shape.T) + [x, y, 0])
+    return blob_mob
+
+
 class DEMHeroAnimation(Scene):
     """
     Main animation scene combining all phases.
@@ -335,23 +1003,42 @@ class DEMHeroAnimation(Scene):
         reveal_duration = 2.0  # Time for all letters (tighter for 15s total)
         letter_delay = reveal_duration / letter_count
 
-        for i in range(letter_count):
-            letter = self.masked_text.letters[i]
-
-            # Scale overshoot animation
+        letters = self.masked_text.letters
+        for letter in letters:
             letter.set_opacity(0)
             letter.scale(0.8)
 
-            self.play(
-                letter.animate.set_opacity(1).scale(1.25),
-                run_time=letter_delay * 0.6,
-                rate_func=rush_from,
-            )
-            self.play(
-                letter.animate.scale(1/1.25),
-                run_time=letter_delay * 0.4,
-                rate_func=rush_into,
-            )
+        # Scale overshoot animation per letter, played back to back in one pass.
+        # Each letter spends 60% of its slot overshooting and 40% settling,
+        # which a single alpha-driven animation keeps (Succession would split
+        # its slot evenly between the two halves).
+        def overshoot_reveal(letter):
+            # Scale the starting outline about its center in place each frame
+            center = letter.get_center()
+            start_points = [
+                (part, part.get_points().copy())
+                for part in letter.family_members_with_points()
+            ]
+
+            def update(mob, alpha):
+                if alpha < 0.6:
+                    t = rush_from(alpha / 0.6)
+                    scale, opacity = interpolate(1, 1.25, t), t
+                else:
+                    t = rush_into((alpha - 0.6) / 0.4)
+                    scale, opacity = interpolate(1.25, 1, t), 1
+                for part, points in start_points:
+                    part.set_points(center + (points - center) * scale)
+                mob.set_opacity(opacity)
+
+            return UpdateFromAlphaFunc(letter, update, run_time=letter_delay, rate_func=linear)
+
+        reveals = [overshoot_reveal(letter) for letter in letters]
+
+        self.play(
+            LaggedStart(*reveals, lag_ratio=1),
+            run_time=reveal_duration,
+        )
 
         # Brief hold
         self.wait(0.3)
@@ -433,6 +1120,29 @@ class DEMHeroAnimation(Scene):
         # Secondary blob for split effect
         secondary_blob = None
 
+        # Persistent unit circle; each frame's shape is an affine image of its points
+        self._unit_circle = Circle(radius=1, fill_opacity=1, stroke_width=0)
+        self._unit_pts = self._unit_circle.get_points().copy()
+
+        # Breathing scale for every step of the phase. Each wait(1/60) below advances
+        # self.time by at least one camera frame, so 1/30 s at the default 30 fps
+        step_dt = max(1/60, 1/self.camera.fps)
+        total_steps = sum(int(duration * 60) for _, _, duration in cursor_path)
+        breath_lut = 1 + 0.05 * np.sin((self.time + np.arange(total_steps) * step_dt) * 3)
+        step_global = 0
+
+        # Last circle written to blob_mob (None after an ellipse); slow frames that
+        # change it by less than submit_tolerance skip the geometry update
+        submit_tolerance = 0.01
+        submitted_radius = None
+        submitted_x, submitted_y = 0.0, 0.0
+
+        if USE_GPU_METABALLS:
+            # Draw the blob from the metaball field with a fragment shader
+            gpu_blob = MetaballShaderMobject(self.metaball_field)
+            self.remove(self.blob_mob)
+            self.add(gpu_blob)
+
         for target_x, target_y, duration in cursor_path:
             # Animate blob following target with physics
             steps = int(duration * 60)
@@ -447,44 +1157,45 @@ class DEMHeroAnimation(Scene):
                 self.blob_physics.update(target_x, target_y, dt=1/60)
 
                 # Update blob position and shape
-                speed = np.sqrt(self.blob_physics.vx**2 + self.blob_physics.vy**2)
-
-                # Stretch blob based on velocity
-                if speed > 0.1:
-                    angle = np.arctan2(self.blob_physics.vy, self.blob_physics.vx)
-                    stretch = 1 + min(speed * 2, 0.5)
-
-                    self.blob_mob.become(
-                        Ellipse(
-                            width=1.5 * stretch * 2,
-                            height=1.5 / stretch * 2,
-                            fill_opacity=1,
-                            stroke_width=0
-                        )
-                        .set_fill(WHITE)
-                        .move_to([self.blob_physics.x, self.blob_physics.y, 0])
-                        .rotate(angle)
-                    )
+                speed = math.hypot(self.blob_physics.vx, self.blob_physics.vy)
+
+                if USE_GPU_METABALLS:
+                    # Same shape as the CPU path: stretched along the velocity, breathing when slow
+                    x, y = self.blob_physics.x, self.blob_physics.y
+                    radius = 1.5 if speed > 0.1 else 1.5 * breath_lut[step_global]
+                    self.metaball_field.set_blobs([(x, y, radius)])
+                    gpu_blob.update_from_field(shapes=[_blob_stretch(self.blob_physics.vx, self.blob_physics.vy)])
                 else:
-                    # Return to circle when slow
-                    self.blob_mob.become(
-                        Circle(
-                            radius=1.5 * (1 + 0.05 * np.sin(self.time * 3)),  # Breathing
-                            fill_opacity=1,
-                            stroke_width=0
-                        )
-                        .set_fill(WHITE)
-                        .move_to([self.blob_physics.x, self.blob_physics.y, 0])
-                    )
+                    x, y = self.blob_physics.x, self.blob_physics.y
+                    vx, vy = self.blob_physics.vx, self.blob_physics.vy
+
+                    # Stretch blob based on velocity
+                    if speed > 0.1:
+                        _update_blob_shape(self.blob_mob, self._unit_pts, x, y, vx, vy)
+                        submitted_radius = None
+                    else:
+                        # Return to circle when slow
+                        radius = 1.5 * breath_lut[step_global]  # Breathing
+
+                        if submitted_radius is None or abs(radius - submitted_radius) > submit_tolerance:
+                            _update_blob_shape(self.blob_mob, self._unit_pts, x, y, vx, vy, radius=radius)
+                            submitted_radius = radius
+                            submitted_x, submitted_y = x, y
+                        elif math.hypot(x - submitted_x, y - submitted_y) > submit_tolerance:
+                            # Same circle, just nudge it
+                            self.blob_mob.shift([x - submitted_x, y - submitted_y, 0])
+                            submitted_x, submitted_y = x, y
 
                 self.wait(1/60)
+                step_global += 1
+
+        if USE_GPU_METABALLS:
+            self.metaball_field.set_blobs([(0, 0, 1.5)])
+            self.remove(gpu_blob)
+            self.add(self.blob_mob)
 
         # Final settle
-        self.blob_mob.become(
-            Circle(radius=1.5, fill_opacity=1, stroke_width=0)
-            .set_fill(WHITE)
-            .move_to(ORIGIN)
-        )
+        self.blob_mob.set_points(self._unit_pts * [1.5, 1.5, 1])
         self.wait(0.3)
 
     def phase_exit(self):
@@ -499,12 +1210,7 @@ class DEMHeroAnimation(Scene):
         )
 
         # Recreate text for exit
-        exit_text = Text(
-            "DEM Systems",
-            font="SF Pro Display",
-            weight=BOLD,
-            font_size=120,
-        )
+        exit_text = cached_text("DEM Systems")
         exit_text.set_fill(WHITE, opacity=1)
         exit_text.center()
 
@@ -544,12 +1250,13 @@ class DEMHeroAnimation(Scene):
         # Reverse-order fade out - faster
         letters_reversed = list(reversed(list(fragments)))
 
-        for letter in letters_reversed:
-            self.play(
-                letter.animate.set_opacity(0),
-                run_time=0.05,
-                rate_func=linear,
-            )
+        self.play(
+            LaggedStart(
+                *[FadeOut(letter, rate_func=linear) for letter in letters_reversed],
+                lag_ratio=0.5,
+            ),
+            run_time=0.05 * len(letters_reversed),
+        )
 
         # Hold on black for loop point
         self.remove(fragments)
@@ -563,12 +1270,7 @@ class TestTypewriter(Scene):
     def construct(self):
         self.camera.background_color = BACKGROUND_COLOR
 
-        text = Text(
-            "DEM Systems",
-            font="SF Pro Display",
-            weight=BOLD,
-            font_size=120,
-        )
+        text = cached_text("DEM Systems")
         text.set_fill(WHITE, opacity=1)
         text.center()
 
@@ -603,36 +1305,18 @@ class TestMetaball(Scene):
 
         # Simple motion test
         physics = BlobPhysics(0, 0, 1.5)
+        unit_pts = Circle(radius=1).get_points().copy()
 
         targets = [(3, 0), (-2, 1), (0, -1), (0, 0)]
 
         for tx, ty in targets:
             for _ in range(60):
                 physics.update(tx, ty)
-                speed = np.sqrt(physics.vx**2 + physics.vy**2)
-
-                if speed > 0.05:
-                    angle = np.arctan2(physics.vy, physics.vx)
-                    stretch = 1 + min(speed * 2, 0.5)
-
-                    blob.become(
-                        Ellipse(
-                            width=1.5 * stretch * 2,
-                            height=1.5 / stretch * 2,
-                            fill_opacity=1,
-                            stroke_width=0
-                        )
-                        .set_fill(WHITE)
-                        .move_to([physics.x, physics.y, 0])
-                        .rotate(angle)
-                    )
-                else:
-                    blob.become(
-                        Circle(radius=1.5, fill_opacity=1, stroke_width=0)
-                        .set_fill(WHITE)
-                        .move_to([physics.x, physics.y, 0])
-                    )
-
+                _update_blob_shape(
+                    blob, unit_pts,
+                    physics.x, physics.y, physics.vx, physics.vy,
+                    stretch_speed=0.05,
+                )
                 self.wait(1/60)
 
         self.wait(1)
@@ -0,0 +1,59 @@
+#version 330
+
+uniform float threshold;
+uniform float n_blobs;
+
+// Blobs as (x, y, radius)
+uniform vec3 blob0;
+uniform vec3 blob1;
+uniform vec3 blob2;
+uniform vec3 blob3;
+uniform vec3 blob4;
+uniform vec3 blob5;
+uniform vec3 blob6;
+uniform vec3 blob7;
+
+// Blob stretch as (cos, sin, factor): an ellipse with semi-axes
+// (radius * factor, radius / factor), the long one along (cos, sin)
+uniform vec3 shape0;
+uniform vec3 shape1;
+uniform vec3 shape2;
+uniform vec3 shape3;
+uniform vec3 shape4;
+uniform vec3 shape5;
+uniform vec3 shape6;
+uniform vec3 shape7;
+
+in vec3 xyz_coords;
+in vec4 v_color;
+
+out vec4 frag_color;
+
+const int MAX_BLOBS = 8;
+
+void main() {
+    vec3 blobs[MAX_BLOBS] = vec3[MAX_BLOBS](
+        blob0, blob1, blob2, blob3,
+        blob4, blob5, blob6, blob7
+    );
+    vec3 shapes[MAX_BLOBS] = vec3[MAX_BLOBS](
+        shape0, shape1, shape2, shape3,
+        shape4, shape5, shape6, shape7
+    );
+
+    float field = 0.0;
+    for(int i = 0; i < int(n_blobs); i++){
+        vec2 diff = xyz_coords.xy - blobs[i].xy;
+        // Into the blob's frame, squashing the long axis back to a circle
+        vec2 axis = shapes[i].xy;
+        vec2 local = vec2(dot(diff, axis), dot(diff, vec2(-axis.y, axis.x)));
+        local *= vec2(1.0 / shapes[i].z, shapes[i].z);
+        field += blobs[i].z * blobs[i].z / (dot(local, local) + 0.0001);
+    }
+
+    // Antialias across about one pixel of field change
+    float aa = fwidth(field);
+    float alpha = smoothstep(threshold - aa, threshold + aa, field);
+
+    frag_color = vec4(v_color.rgb, v_color.a * alpha);
+}
@@ -0,0 +1,15 @@
+#version 330
+
+in vec3 point;
+in vec4 rgba;
+
+out vec3 xyz_coords;
+out vec4 v_color;
+
+#INSERT emit_gl_Position.glsl
+
+void main(){
+    xyz_coords = point;
+    v_color = rgba;
+    emit_gl_Position(point);
+}